@@ -1,8 +1,18 @@
-from fastapi import APIRouter, Body
+import asyncio
+from fastapi import APIRouter, Body, Request
 from pydantic import BaseModel
 from app.services.chat_engine import ChatEngine
 from fastapi.responses import StreamingResponse, JSONResponse
-from app.services.elevenlabs_tts import synthesize_reply_as_stream
+from app.services.tts_cache import get_or_synthesize
+from app.helpers.sentence_buffer import SentenceBuffer
+
+try:
+    # FastAPI's native SSE response serializes Pydantic models on the
+    # Rust side and handles keep-alive pings automatically
+    from fastapi.sse import EventSourceResponse, ServerSentEvent
+    _HAS_FASTAPI_SSE = True
+except ImportError:  # older FastAPI — hand-roll the SSE wire format
+    _HAS_FASTAPI_SSE = False
 
 router = APIRouter()
 
@@ -12,6 +22,9 @@ class ChatRequest(BaseModel):
     mode: str
     voice_enabled: bool = True 
 
+class ChatDelta(BaseModel):
+    token: str
+
 class ChatResponse(BaseModel):
     reply: str
     prompt_tokens: int
@@ -30,17 +43,48 @@ async def chat_endpoint(request: ChatRequest):
     )
     return ChatResponse(**result)
 
+# === Chat endpoint for streaming reply tokens over SSE ===
+if _HAS_FASTAPI_SSE:
+    # fastapi.sse only encodes events when the path operation itself is
+    # a generator declared with response_class=EventSourceResponse — the
+    # encoding lives in the routing layer, so wrapping a generator in
+    # EventSourceResponse(...) manually would skip it entirely.
+    @router.post("/stream", response_class=EventSourceResponse)
+    async def chat_stream_endpoint(request: ChatRequest):
+        print(f"📡 [/chat/stream] message received from {request.user_id}")
+
+        token_stream = ChatEngine.generate_reply_stream(
+            user_id=request.user_id,
+            message=request.message,
+            mode=request.mode,
+        )
+        async for token in token_stream:
+            yield ServerSentEvent(data=ChatDelta(token=token))
+else:
+    @router.post("/stream")
+    async def chat_stream_endpoint(request: ChatRequest):
+        print(f"📡 [/chat/stream] message received from {request.user_id}")
+
+        token_stream = ChatEngine.generate_reply_stream(
+            user_id=request.user_id,
+            message=request.message,
+            mode=request.mode,
+        )
+
+        async def text_stream():
+            async for token in token_stream:
+                yield f"data: {ChatDelta(token=token).model_dump_json()}\n\n"
+        return StreamingResponse(
+            content=text_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
 # === Chat endpoint for streaming TTS audio ===
 @router.post("/speak")
-async def chat_speak_endpoint(request: ChatRequest):
+async def chat_speak_endpoint(request: ChatRequest, http_request: Request):
     print(f"📡 [/chat/speak] Received TTS request | voice_enabled={request.voice_enabled}")
 
-    result = await ChatEngine.generate_reply(
-        user_id=request.user_id,
-        message=request.message,
-        mode=request.mode,
-    )
-
     if not request.voice_enabled:
         print("🔇 [BACKEND] voice_enabled is FALSE — skipping ElevenLabs.")
         return JSONResponse(
@@ -48,18 +92,62 @@ async def chat_speak_endpoint(request: ChatRequest):
             status_code=200
         )
 
-    voice_id = result.get("voice_id")
-    print(f"🗣️ Sending to ElevenLabs: \"{result['reply'][:60]}...\" | voice_id={voice_id}")
-    audio_stream = synthesize_reply_as_stream(result["reply"], voice_id)
+    voice_id = ChatEngine.get_voice_id(request.user_id)
+
+    # Producer/consumer hand-off: the producer pulls from ElevenLabs at
+    # full speed while the consumer drains at the client's pace, so a
+    # slow client never stalls the upstream socket. maxsize bounds the
+    # buffered audio to 8 chunks.
+    chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+
+    async def producer():
+        try:
+            # Pipeline LLM tokens through a sentence buffer so the first
+            # sentence hits ElevenLabs while the rest is still generating.
+            buffer = SentenceBuffer()
+            token_stream = ChatEngine.generate_reply_stream(
+                user_id=request.user_id,
+                message=request.message,
+                mode=request.mode,
+            )
+            async for token in token_stream:
+                for sentence in buffer.feed(token):
+                    print(f"🗣️ Sending to ElevenLabs: \"{sentence[:60]}...\" | voice_id={voice_id}")
+                    async for chunk in get_or_synthesize(sentence, voice_id):
+                        await chunk_queue.put(chunk)
+            remainder = buffer.flush()
+            if remainder:
+                print(f"🗣️ Sending to ElevenLabs: \"{remainder[:60]}...\" | voice_id={voice_id}")
+                async for chunk in get_or_synthesize(remainder, voice_id):
+                    await chunk_queue.put(chunk)
+            await chunk_queue.put(None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ [/chat/speak] Producer failed: {e}")
+            await chunk_queue.put(None)
+
+    producer_task = asyncio.create_task(producer())
+
+    async def audio_stream():
+        try:
+            while (chunk := await chunk_queue.get()) is not None:
+                if await http_request.is_disconnected():
+                    print("🔌 [/chat/speak] Client disconnected — stopping stream")
+                    break
+                yield chunk
+        finally:
+            producer_task.cancel()
+
     return StreamingResponse(
-        content=audio_stream,
+        content=audio_stream(),
         media_type="audio/mpeg",
         status_code=200
     )
 
 # === Endpoint to convert text to speech using active persona ===
 @router.post("/speak-from-text")
-def speak_from_text(
+async def speak_from_text(
     user_id: str = Body(..., embed=True),
     reply: str = Body(..., embed=True)
 ):
@@ -75,9 +163,9 @@ def speak_from_text(
         voice_id = ChatEngine.get_voice_id(user_id)
         print(f"🗣️ Using voice_id={voice_id}")
 
-        # Generate and stream audio
-        print(f"🎙️ [Backend] Calling synthesize_reply_as_stream...")
-        audio_stream = synthesize_reply_as_stream(reply, voice_id)
+        # Generate and stream audio (cache-aware)
+        print(f"🎙️ [Backend] Calling get_or_synthesize...")
+        audio_stream = get_or_synthesize(reply, voice_id)
         print(f"🎙️ [Backend] Audio stream created, returning StreamingResponse...")
         
         return StreamingResponse(
@@ -1,10 +1,19 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import functools
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Response
 from pydantic import BaseModel
 from app.services.persona_manager import PersonaManager
 from app.services.chat_engine import ChatEngine
 
 router = APIRouter(prefix="/personas", tags=["Personas"])
 
+
+# Persona files only change on disk edits, so the directory scan +
+# YAML parse per request is wasted work — cache the listing in-process.
+@functools.lru_cache(maxsize=1)
+def _cached_personas() -> tuple:
+    return tuple(PersonaManager.list_personas())
+
 class PersonaSelectRequest(BaseModel):
     user_id: str
     persona_name: str
@@ -14,38 +23,51 @@ class ActivePersonaRequest(BaseModel):
 
 # === List personas ===
 @router.get("/list")
-def list_personas():
-    personas = PersonaManager.list_personas()
+async def list_personas(response: Response):
+    personas = list(_cached_personas())
     if not personas:
+        # Don't memoize an empty scan — personas added later should show
+        # up without a server restart
+        _cached_personas.cache_clear()
         raise HTTPException(status_code=404, detail="No personas found")
+    response.headers["Cache-Control"] = "max-age=5"
     return {"personas": personas}
 
 # === Select persona and clear context ===
 @router.post("/select")
-def select_persona(request: PersonaSelectRequest):
+async def select_persona(request: PersonaSelectRequest, background_tasks: BackgroundTasks):
     """
     Switches the active persona for a given user, clears chat context,
-    and preloads the new persona immediately.
+    and preloads the new persona in the background after responding.
     """
     try:
-        PersonaManager.set_persona(request.user_id, request.persona_name)
+        # set_persona rescans the persona directory and parses every
+        # YAML file, and get_active_metadata reads YAML on a cache miss
+        # — keep that disk work off the event loop
+        await asyncio.to_thread(
+            PersonaManager.set_persona, request.user_id, request.persona_name
+        )
 
         # 🧹 Clear old chat context
         ChatEngine.clear_context(request.user_id)
 
-        # ⚡ Preload new persona data
-        ChatEngine.preload_persona(request.user_id)
+        # ⚡ Preload new persona data after the response is sent — the
+        # UI renders the switch immediately; first chat self-heals via
+        # _load_persona_if_needed if it races the preload
+        background_tasks.add_task(ChatEngine.preload_persona, request.user_id)
 
         return {
             "message": f"Persona switched to '{request.persona_name}', context cleared, and persona preloaded",
-            "active_persona": PersonaManager.get_active_metadata(request.user_id)
+            "active_persona": await asyncio.to_thread(
+                PersonaManager.get_active_metadata, request.user_id
+            )
         }
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 # === Get active persona ===
 @router.post("/active")
-def get_active_persona(request: ActivePersonaRequest):
+async def get_active_persona(request: ActivePersonaRequest):
     active = PersonaManager.get_active_metadata(request.user_id)
     if not active:
         raise HTTPException(status_code=404, detail="No active persona found")
@@ -0,0 +1,56 @@
+import re
+
+# Trailing words that end with a period but don't end a sentence
+_ABBREVIATIONS = {
+    "dr.", "mr.", "mrs.", "ms.", "prof.", "sr.", "jr.",
+    "st.", "vs.", "etc.", "e.g.", "i.e.",
+}
+
+
+class SentenceBuffer:
+    """
+    Accumulates streamed token deltas and emits complete sentences as
+    soon as they are ready, so TTS synthesis can start before the LLM
+    has finished generating the full reply.
+
+    A boundary is a `.`, `!` or `?` followed by whitespace, unless the
+    sentence so far is shorter than min_length or ends in a known
+    abbreviation. Decimals like 3.14 never split since the period is
+    not followed by whitespace.
+    """
+
+    def __init__(self, min_length: int = 10):
+        self.min_length = min_length
+        self._buffer = ""
+
+    # === Feed a token delta, get back any completed sentences ===
+    def feed(self, token: str) -> list[str]:
+        self._buffer += token
+        sentences = []
+        while True:
+            split_at = self._find_boundary()
+            if split_at is None:
+                break
+            sentence = self._buffer[:split_at].strip()
+            self._buffer = self._buffer[split_at:]
+            if sentence:
+                sentences.append(sentence)
+        return sentences
+
+    # === Flush whatever is left once the stream ends ===
+    def flush(self) -> str:
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return remainder
+
+    def _find_boundary(self):
+        for match in re.finditer(r"[.!?](?=\s)", self._buffer):
+            end = match.end()
+            candidate = self._buffer[:end].strip()
+            if len(candidate) < self.min_length:
+                continue
+            last_word = candidate.rsplit(maxsplit=1)[-1].lower()
+            if last_word in _ABBREVIATIONS:
+                continue
+            return end
+        return None
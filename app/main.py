@@ -24,3 +24,8 @@ async def log_openrouter_credits():
         print(credits)
     except Exception as e:
         print("❌ Failed to fetch OpenRouter credits:", str(e))
+
+@app.on_event("shutdown")
+async def close_tts_client():
+    from app.services.elevenlabs_tts import close_client
+    await close_client()
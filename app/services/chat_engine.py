@@ -1,4 +1,5 @@
 import httpx
+import json
 import os
 from dotenv import load_dotenv
 from app.helpers.persona_loader import load_persona
@@ -88,6 +89,49 @@ class ChatEngine:
                 "voice_id": None,
             }
 
+    # === Streaming chat operations ===
+    @staticmethod
+    async def generate_reply_stream(user_id: str, message: str, mode: str):
+        """
+        Streams the reply as token deltas (AsyncIterator[str]) instead
+        of awaiting the full completion, so callers can pipeline work
+        (e.g. TTS synthesis) against LLM decode.
+        """
+        if mode != "safe":
+            yield "Unfiltered mode not implemented yet."
+            return
+
+        persona = ChatEngine._get_persona(user_id)
+        messages = persona["messages"]
+        messages.append({"role": "user", "content": message})
+
+        payload = {
+            "model": MODEL,
+            "messages": messages,
+            "max_tokens": 300,
+            "temperature": 0.8,
+            "stream": True,
+        }
+
+        async with httpx.AsyncClient() as client:
+            async with client.stream(
+                "POST",
+                f"{API_BASE}/chat/completions",
+                headers=HEADERS,
+                json=payload,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[len("data: "):]
+                    if data == "[DONE]":
+                        break
+                    delta = json.loads(data)["choices"][0].get("delta", {})
+                    token = delta.get("content")
+                    if token:
+                        yield token
+
     # === OpenRouter API interaction ===
     @staticmethod
     async def _use_openrouter(user_id: str, message: str) -> dict:
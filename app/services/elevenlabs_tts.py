@@ -1,4 +1,4 @@
-from elevenlabs.client import ElevenLabs
+import httpx
 import os
 from dotenv import load_dotenv
 from pathlib import Path
@@ -9,19 +9,47 @@ env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
 API_KEY = os.getenv("ELEVENLABS_API_KEY")
-client = ElevenLabs(api_key=API_KEY)
+API_BASE = "https://api.elevenlabs.io/v1"
+CHUNK_SIZE = 16 * 1024
+
+# Shared client so consecutive TTS requests reuse one TLS session
+# (handshake is 1–2 RTTs) and HTTP/2 can multiplex overlapping
+# sentence-pipeline requests on a single connection. Created lazily so
+# it binds to the running event loop.
+_client: httpx.AsyncClient = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 # === Synthesize text to speech using ElevenLabs ===
-def synthesize_reply_as_stream(text: str, voice_id: str = None):
+async def synthesize_reply_as_stream(text: str, voice_id: str = None):
     """
-    Stream TTS audio for a given text. If no voice_id is provided,
-    automatically retrieves it from the currently active persona
-    using ChatEngine (single source of truth).
+    Async generator yielding TTS audio chunks for a given text.
+    Uses the ElevenLabs streaming endpoint so the first bytes arrive
+    before synthesis finishes, and stays fully async so Starlette
+    never offloads consumption to its threadpool.
+
+    If no voice_id is provided, automatically retrieves it from the
+    currently active persona using ChatEngine (single source of truth).
     """
     print(f"🎙️ [ElevenLabs] Starting TTS synthesis...")
     print(f"🎙️ [ElevenLabs] API_KEY exists: {bool(API_KEY)}")
-    print(f"🎙️ [ElevenLabs] API_KEY length: {len(API_KEY) if API_KEY else 0}")
-    
+
     if not voice_id:
         voice_id = ChatEngine.get_voice_id()
         print(f"🎙️ No voice_id provided. Using persona voice: {voice_id}")
@@ -30,15 +58,21 @@ def synthesize_reply_as_stream(text: str, voice_id: str = None):
     print(f"🎙️ [ElevenLabs] Cleaned text: {cleaned_text[:50]}...")
     print(f"🎙️ [ElevenLabs] Voice ID: {voice_id}")
 
+    url = f"{API_BASE}/text-to-speech/{voice_id}/stream"
+    payload = {
+        "text": cleaned_text,
+        "model_id": "eleven_turbo_v2_5",
+    }
+    headers = {"xi-api-key": API_KEY or ""}
+
     try:
-        print(f"🎙️ [ElevenLabs] Calling ElevenLabs API...")
-        stream = client.text_to_speech.stream(
-            voice_id=voice_id,
-            model_id="eleven_monolingual_v1",
-            text=cleaned_text,
-        )
-        print(f"🎙️ [ElevenLabs] Stream created successfully")
-        return stream
+        print(f"🎙️ [ElevenLabs] Calling ElevenLabs streaming API...")
+        client = await get_client()
+        async with client.stream("POST", url, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                yield chunk
+        print(f"🎙️ [ElevenLabs] Stream finished")
     except Exception as e:
         error_msg = str(e).lower()
         if "quota" in error_msg or "credits" in error_msg or "limit" in error_msg:
@@ -48,5 +82,5 @@ def synthesize_reply_as_stream(text: str, voice_id: str = None):
             print(f"❌ [ElevenLabs] API KEY INVALID: {e}")
             print(f"💡 [ElevenLabs] Please check your ElevenLabs API key")
         else:
-            print(f"❌ [ElevenLabs] Error creating stream: {e}")
+            print(f"❌ [ElevenLabs] Error streaming audio: {e}")
         raise
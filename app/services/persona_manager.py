@@ -8,6 +8,7 @@ class PersonaManager:
     """
 
     _active_personas = {}  # { user_id: "persona.yml" }
+    _active_meta_cache = {}  # { user_id: metadata dict } — invalidated by set_persona
     _characters_dir = Path("app/config/characters")
 
     # === List all available personas ===
@@ -47,6 +48,7 @@ class PersonaManager:
 
         selected_file = matches[0]["file"]
         cls._active_personas[user_id] = selected_file
+        cls._active_meta_cache.pop(user_id, None)
         print(f"🔄 Persona for user {user_id} switched to {selected_file}")
 
     # === Get the active persona file path for a user ===
@@ -81,6 +83,21 @@ class PersonaManager:
     def get_active_metadata(cls, user_id: str) -> dict:
         """
         Returns metadata for the active persona of a given user.
+        Served from an in-process cache; set_persona invalidates it so
+        repeated UI polls cost a dict lookup instead of a YAML parse.
+        """
+        cached = cls._active_meta_cache.get(user_id)
+        if cached is not None:
+            return cached
+        meta = cls._load_active_metadata(user_id)
+        if meta:
+            cls._active_meta_cache[user_id] = meta
+        return meta
+
+    @classmethod
+    def _load_active_metadata(cls, user_id: str) -> dict:
+        """
+        Loads metadata for the active persona from disk.
         If no persona is set, defaults to default_persona.yml.
         """
         active_file = cls._active_personas.get(user_id)
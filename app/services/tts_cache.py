@@ -0,0 +1,101 @@
+import hashlib
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import aiofiles
+
+from app.services.elevenlabs_tts import synthesize_reply_as_stream
+
+CACHE_DIR = Path("app/cache/tts")
+MAX_CACHE_BYTES = 500 * 1024 * 1024  # 500 MB cap before LRU eviction kicks in
+CHUNK_SIZE = 16 * 1024
+
+# LRU index of cached files: { sha256 key: file size in bytes }
+_lru: OrderedDict = OrderedDict()
+
+
+# === Cache key helpers ===
+def _normalize(text: str) -> str:
+    """Collapse whitespace and case so trivially-different replies share a key."""
+    return re.sub(r"\s+", " ", text.strip().lower())
+
+
+def _cache_key(text: str, voice_id: str = None) -> str:
+    norm = _normalize(text)
+    return hashlib.sha256(f"{voice_id or 'default'}|{norm}".encode()).hexdigest()
+
+
+# === LRU index management ===
+def _rebuild_index():
+    """Rebuild the LRU index from files left over from a previous run."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for file in sorted(CACHE_DIR.glob("*.mp3"), key=lambda f: f.stat().st_mtime):
+        _lru[file.stem] = file.stat().st_size
+
+
+_rebuild_index()
+
+
+def _evict_if_needed():
+    total = sum(_lru.values())
+    while total > MAX_CACHE_BYTES and _lru:
+        key, size = _lru.popitem(last=False)
+        total -= size
+        try:
+            (CACHE_DIR / f"{key}.mp3").unlink()
+            print(f"🧹 [TTS Cache] Evicted {key[:12]}… ({size} bytes)")
+        except OSError:
+            pass
+
+
+# === Public entry point ===
+def get_or_synthesize(text: str, voice_id: str = None):
+    """
+    Returns an async generator yielding MP3 chunks for the given text.
+    Cache hits stream straight from disk; misses stream from ElevenLabs
+    while teeing the bytes into the cache for next time.
+    """
+    key = _cache_key(text, voice_id)
+    path = CACHE_DIR / f"{key}.mp3"
+
+    if key in _lru and path.exists():
+        _lru.move_to_end(key)
+        print(f"⚡ [TTS Cache] Hit {key[:12]}… — serving from disk")
+        return _stream_from_disk(path)
+
+    print(f"🌐 [TTS Cache] Miss {key[:12]}… — synthesizing")
+    return _synthesize_and_store(text, voice_id, key, path)
+
+
+# === Internal streaming generators ===
+async def _stream_from_disk(path: Path):
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def _synthesize_and_store(text: str, voice_id: str, key: str, path: Path):
+    stream = synthesize_reply_as_stream(text, voice_id)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".part")
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            async for chunk in stream:
+                tmp.write(chunk)
+                written += len(chunk)
+                yield chunk
+        os.replace(tmp_path, path)
+        _lru[key] = written
+        _evict_if_needed()
+        print(f"💾 [TTS Cache] Stored {key[:12]}… ({written} bytes)")
+    except BaseException:
+        # Don't leave half-written audio behind if the client disconnects
+        # or ElevenLabs errors mid-stream.
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
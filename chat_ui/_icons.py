@@ -0,0 +1,13 @@
+from functools import lru_cache
+from PyQt6.QtGui import QIcon
+
+
+@lru_cache(maxsize=32)
+def icon(path: str) -> QIcon:
+    """Returns a shared QIcon for the given asset path.
+
+    QIcon(path) re-opens and re-parses the SVG on every call; caching
+    here means each asset is parsed once per process no matter how
+    often buttons are rebuilt or toggled.
+    """
+    return QIcon(path)
@@ -1,10 +1,10 @@
-import re
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QFrame, QSizePolicy
 )
 from PyQt6.QtCore import QSize, QCoreApplication, Qt, QTimer
-from PyQt6.QtGui import QIcon, QKeyEvent
+from PyQt6.QtGui import QKeyEvent
 
+from chat_ui._icons import icon
 from chat_ui.voice_recorder import VoiceRecorder
 from chat_ui.components.VoiceToggleSwitch import VoiceToggleSwitch
 from chat_ui.right.chat_window import UserInputEvent
@@ -31,7 +31,7 @@ class ChatInput(QWidget):
     def __init__(self, chat_window, parent=None):
         super().__init__(parent)
         self.chat_window = chat_window
-        self.recorder = VoiceRecorder()
+        self.recorder = None  # built lazily on first mic use
         self.voice_mode = False
 
         # --- FIX: AGGRESSIVE TRANSPARENCY AND BORDER FOR DEBUGGING ---
@@ -115,7 +115,16 @@ class ChatInput(QWidget):
         self.entry.setMinimumHeight(36)
         self.entry.setMaximumHeight(120)
         self.entry.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.entry.textChanged.connect(self.adjust_textedit_height)
+
+        # Debounce height recalculation — textChanged fires per keystroke
+        # and each recalculation forces a document layout pass plus a
+        # relayout of the bubble, so batch bursts into one pass per 120 ms
+        self._last_capped_height = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(120)
+        self._resize_timer.timeout.connect(self.adjust_textedit_height)
+        self.entry.textChanged.connect(self._resize_timer.start)
         self.bubble_layout.addWidget(self.entry)
 
         # === Bottom row with buttons ===
@@ -135,7 +144,7 @@ class ChatInput(QWidget):
         # === Chat Toggle Button ===
         self.chat_toggle_button = QPushButton()
         self.chat_toggle_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.chat_toggle_button.setIcon(QIcon("chat_ui/assets/chat.svg"))
+        self.chat_toggle_button.setIcon(icon("chat_ui/assets/chat.svg"))
         self.chat_toggle_button.setIconSize(QSize(18, 18))
         self.chat_toggle_button.setFixedSize(30, 30)
         self.chat_toggle_button.setCheckable(True)
@@ -145,7 +154,7 @@ class ChatInput(QWidget):
         # === Microphone Button ===
         self.mic_button = QPushButton()
         self.mic_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.mic_button.setIcon(QIcon("chat_ui/assets/mic.svg"))
+        self.mic_button.setIcon(icon("chat_ui/assets/mic.svg"))
         self.mic_button.setIconSize(QSize(18, 18))
         self.mic_button.setFixedSize(30, 30)
         self.mic_button.setCheckable(True)
@@ -154,7 +163,7 @@ class ChatInput(QWidget):
         # === Send Button ===
         self.send_button = QPushButton()
         self.send_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.send_button.setIcon(QIcon("chat_ui/assets/arrow-up-circle-fill.svg"))
+        self.send_button.setIcon(icon("chat_ui/assets/arrow-up-circle-fill.svg"))
         self.send_button.setIconSize(QSize(22, 22))
         self.send_button.setFixedSize(32, 32)
         self.send_button.clicked.connect(self.send_message)
@@ -195,6 +204,9 @@ class ChatInput(QWidget):
         padding = 20
         total_height = int(doc_height + padding)
         capped_height = min(max(36, total_height), 120)
+        if capped_height == self._last_capped_height:
+            return
+        self._last_capped_height = capped_height
         self.entry.setFixedHeight(capped_height)
 
     def set_input_mode(self, mode):
@@ -203,19 +215,22 @@ class ChatInput(QWidget):
         if self.voice_mode:
             self.entry.setPlaceholderText("Listening...")
             self.send_button.setEnabled(False)
-            self.mic_button.setIcon(QIcon("chat_ui/assets/stop.svg"))
+            self.mic_button.setIcon(icon("chat_ui/assets/stop.svg"))
             self.mic_button.setChecked(True)
 
+            if self.recorder is None:
+                self.recorder = VoiceRecorder()
             self.recorder.continuous_mode = True
             self.recorder.start_recording_async(
                 self.voice_input_callback,
                 on_status=self.update_status
             )
         else:
-            self.recorder.stop()
+            if self.recorder:
+                self.recorder.stop()
             self.entry.setPlaceholderText("Start typing...")
             self.send_button.setEnabled(True)
-            self.mic_button.setIcon(QIcon("chat_ui/assets/mic.svg"))
+            self.mic_button.setIcon(icon("chat_ui/assets/mic.svg"))
             self.mic_button.setChecked(False)
 
     def send_message(self):
@@ -226,9 +241,8 @@ class ChatInput(QWidget):
         self.entry.clear()
         self.adjust_textedit_height()
 
-        match = re.match(r"^(?:switch|swap)\s+to\s+(.+)$", message.lower())
-        if match:
-            persona_name = match.group(1).strip()
+        persona_name = PersonaService.try_parse_switch(message)
+        if persona_name:
             print(f"🔄 Typed command detected — switching to persona: {persona_name}")
             PersonaService.select_persona(persona_name)
 
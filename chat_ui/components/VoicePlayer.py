@@ -23,8 +23,13 @@ print("🔧 FFMPEG_BINARY =", ffmpeg_path)
 
 class VoicePlayer:
     # === VoicePlayer for handling ElevenLabs TTS playback ===
-    def play_reply_from_backend(self, text: str, voice_enabled=True, on_start=None):
-        """Request ElevenLabs stream from backend and play it."""
+    def play_reply_from_backend(self, text: str, voice_enabled=True, on_start=None, recorder=None):
+        """Request ElevenLabs stream from backend and play it.
+
+        When a VoiceRecorder is passed, it is told playback started so
+        speech detected mid-playback can barge in and cut the audio off
+        via sd.stop().
+        """
         if not voice_enabled:
             print("🔇 [VoicePlayer] Voice disabled — skipping playback")
             return None
@@ -66,10 +71,18 @@ class VoicePlayer:
                     on_start(audio_duration_seconds)  # Pass duration to callback
 
                 print("🔊 [VoicePlayer] Playing audio now...")
-                sd.play(samples, samplerate=audio.frame_rate)
-                sd.wait()
+                if recorder is not None:
+                    recorder.interrupt_callback = sd.stop
+                    recorder.notify_speaking(True)
+                try:
+                    sd.play(samples, samplerate=audio.frame_rate)
+                    sd.wait()
+                finally:
+                    if recorder is not None:
+                        recorder.notify_speaking(False)
+                        recorder.interrupt_callback = None
                 print("✅ [VoicePlayer] Playback finished")
-                
+
                 return audio_duration_seconds
 
         except Exception as e:
@@ -13,7 +13,6 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from chat_ui.right.chat_bubble import ChatBubble
 from chat_ui.services.persona_service import PersonaService, SessionManager
-from chat_ui.voice_recorder import VoiceRecorder
 from chat_ui.components.VoicePlayer import VoicePlayer
 
 # === Text to Phoneme Conversion ===
@@ -390,7 +389,6 @@ class ChatWindow(QWidget):
         super().__init__()
         self.persona_name = "Assistant"
         self.setWindowTitle("NeuraPal - AI Chat")
-        self.recorder = VoiceRecorder()
         self.voice_player = VoicePlayer()
         self.last_user_emotion = 'neutral'  # Store the last user emotion
 
@@ -508,11 +506,15 @@ class ChatWindow(QWidget):
                 # Create a custom event that includes audio duration for voice sync
                 QCoreApplication.postEvent(self, ReplyEvent(reply_text, audio_duration))
     
+            # Hand the active recorder to the player so speech during
+            # playback can barge in and stop the audio
+            recorder = self.input_box.recorder if self.input_box else None
+
             # Start voice playback in background thread
             voice_thread = threading.Thread(
                 target=self.voice_player.play_reply_from_backend,
                 args=(reply_text,),
-                kwargs={"voice_enabled": True, "on_start": on_start},
+                kwargs={"voice_enabled": True, "on_start": on_start, "recorder": recorder},
                 daemon=True
             )
             voice_thread.start()
@@ -1,7 +1,13 @@
+import re
 import uuid
 import requests
 import os
 
+# Compiled once — shared by the typed (ChatInput) and voice
+# (VoiceRecorder) persona-command paths
+_CMD = re.compile(r"^(?:switch|swap)\s+to\s+(.+)$", re.IGNORECASE)
+_SCRUB = re.compile(r"[^\w\s-]")
+
 class SessionManager:
     """
     Handles temporary user ID generation for persona requests.
@@ -30,6 +36,24 @@ class PersonaService:
     chat_window = None
     vrm_container = None
 
+    @classmethod
+    def try_parse_switch(cls, text: str):
+        """
+        Returns the persona name if text is a "switch/swap to …" command,
+        else None. Cheap prefix gate first so ordinary messages never pay
+        for the regex; the name is scrubbed and lowercased the same way
+        for typed and spoken commands.
+        """
+        if len(text) < 9:  # shortest valid command: "swap to X"
+            return None
+        head = text[:7].lower()
+        if not head.startswith(("switch", "swap")):
+            return None
+        match = _CMD.match(text.strip())
+        if not match:
+            return None
+        return _SCRUB.sub("", match.group(1)).strip().lower() or None
+
     @classmethod
     def register_chat_window(cls, chat_window):
         """Registers chat_window instance for auto-greeting."""
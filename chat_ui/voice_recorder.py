@@ -1,29 +1,73 @@
-import re
-import sounddevice as sd
+import os
 import numpy as np
-import queue
 import threading
-import webrtcvad
-from faster_whisper import WhisperModel
+from collections import deque
 import time
 from chat_ui.services.persona_service import PersonaService
 
+# sounddevice, webrtcvad and faster_whisper are imported lazily so the
+# Qt UI doesn't pay their load cost at startup — keyboard-only users
+# never touch them.
+
+__all__ = ["VoiceRecorder"]
+
 
 class VoiceRecorder:
     # === Initialization ===
-    def __init__(self, model_name="base", silence_duration=4.0, aggressiveness=3):
+    def __init__(self, model_name="base", silence_duration=0.7, aggressiveness=3):
         # 🎙️ Audio config
         self.sample_rate = 16000
-        self.block_duration = 30  # ms
+        self.block_duration = 32  # ms — Silero VAD expects 512-sample chunks at 16 kHz
         self.block_size = int(self.sample_rate * self.block_duration / 1000)
 
         # === Voice Activity Detection
-        self.vad = webrtcvad.Vad(aggressiveness)
+        # Silero VAD is far more accurate than webrtcvad and runs a 32 ms
+        # chunk in <1 ms on CPU, which lets the trailing-silence cutoff
+        # drop from 4 s to 0.7 s. webrtcvad stays as an offline fallback.
+        self.vad_model = None
+        self.vad = None
+        try:
+            import torch
+            self._torch = torch
+            self.vad_model = torch.hub.load(
+                "snakers4/silero-vad", "silero_vad", trust_repo=True
+            )[0]
+            print("🎧 Silero VAD loaded")
+        except Exception as e:
+            print(f"⚠️ Silero VAD unavailable ({e}) — falling back to webrtcvad")
+            import webrtcvad
+            self.vad = webrtcvad.Vad(aggressiveness)
+
+        # Preallocated scratch for the webrtcvad fallback conversion —
+        # avoids allocating fresh int16/bytes buffers on every block of
+        # the VAD hot path. The conversion itself runs through the fused
+        # kernel in chat_ui._audio_kernels (Numba-jitted when available).
+        self._vad_frame = int(self.sample_rate * 0.03)
+        self._i16_scratch = np.empty(self._vad_frame, dtype=np.int16)
+        self._f32_to_pcm16 = None
+        if self.vad is not None:
+            # Warm the JIT now so the first real block doesn't pay
+            # compile cost mid-utterance
+            from chat_ui._audio_kernels import f32_to_pcm16
+            self._f32_to_pcm16 = f32_to_pcm16
+            f32_to_pcm16(
+                np.zeros(self._vad_frame, dtype=np.float32), self._i16_scratch
+            )
+
+        # Preallocated utterance buffer (30 s at 16 kHz ≈ 1.8 MB) —
+        # blocks are written in sequentially so no per-utterance list
+        # append + final concatenate copy is needed. Grown by doubling
+        # in the rare case an utterance runs longer.
+        self._audio_buf = np.empty(self.sample_rate * 30, dtype=np.float32)
 
         # === State
-        self.audio_queue = queue.Queue()
+        # deque append/popleft are atomic under the GIL, so the PortAudio
+        # realtime callback never takes a mutex (queue.Queue does, which
+        # risks audio dropouts). Single producer, single consumer.
+        self.audio_queue = deque(maxlen=256)
+        self._audio_event = threading.Event()
         self.recording = False
-        self.model = WhisperModel(model_name, compute_type="int8", device="cpu")
+        self.model_name = model_name
 
         self.silence_duration = silence_duration
         self._last_voice_time = time.time()
@@ -31,47 +75,181 @@ class VoiceRecorder:
         self.status_callback = None
         self.max_empty_loops = 3
 
+        # === Turn-taking state machine: idle → listening → processing
+        # (plus "speaking" while TTS playback is active, so user speech
+        # can interrupt it)
+        self.state = "idle"
+        self.interrupt_callback = None
+
+        # Persistent input stream — opened once per session instead of
+        # per utterance, since device open can block 50–200 ms
+        self._stream = None
+        self._prewarmed = False
+
+        # Whisper model, loaded lazily under an explicit lock — the
+        # prewarm thread and the recording loop can both hit the first
+        # access, and cached_property stopped locking in Python 3.12
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    # === Whisper model (loaded on first transcription, not at UI start) ===
+    @property
+    def model(self):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self._load_model()
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self._model = value
+
+    def _load_model(self):
+        # Size the BLAS pool before CTranslate2 initializes it
+        os.environ.setdefault(
+            "OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2))
+        )
+        from faster_whisper import WhisperModel
+
+        # Prefer GPU float16 when CUDA is available — order-of-magnitude
+        # faster than CPU int8 for the Whisper encoder/decoder.
+        device, compute_type = self._pick_whisper_backend()
+        print(f"🧠 Whisper backend: device={device}, compute_type={compute_type}")
+        return WhisperModel(
+            self.model_name,
+            device=device,
+            compute_type=compute_type,
+            num_workers=2,
+            cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+        )
+
+    # === Whisper backend selection ===
+    @staticmethod
+    def _pick_whisper_backend():
+        try:
+            import ctranslate2
+            if ctranslate2.get_cuda_device_count() > 0:
+                return "cuda", "float16"
+        except Exception as e:
+            print(f"⚠️ CUDA probe failed, falling back to CPU: {e}")
+        return "cpu", "int8"
+
     # === Callback for Audio Input ===
     def _callback(self, indata, frames, time_info, status):
         if status:
             print("Status:", status)
         audio_data = indata[:, 0]
-        self.audio_queue.put(audio_data.copy())
+        self.audio_queue.append(audio_data.copy())
+        self._audio_event.set()
 
     # === Speech Detection ===
     def _is_speech(self, chunk):
-        pcm = (chunk * 32768).astype(np.int16).tobytes()
-        return self.vad.is_speech(pcm, self.sample_rate)
+        if self.vad_model is not None:
+            tensor = self._torch.from_numpy(
+                np.ascontiguousarray(chunk, dtype=np.float32)
+            )
+            return self.vad_model(tensor, self.sample_rate).item() > 0.5
 
-    # === Recording Loop ===
-    def _record_until_silence(self):
-        if self.status_callback:
-            self.status_callback("Listening...")
+        # webrtcvad fallback only accepts 10/20/30 ms frames — trim the
+        # 32 ms block down to its first 30 ms and convert into the
+        # preallocated scratch via the fused kernel
+        if self._f32_to_pcm16 is None:
+            from chat_ui._audio_kernels import f32_to_pcm16
+            self._f32_to_pcm16 = f32_to_pcm16
+        n = min(len(chunk), self._vad_frame)
+        self._f32_to_pcm16(
+            np.ascontiguousarray(chunk[:n], dtype=np.float32),
+            self._i16_scratch[:n],
+        )
+        return self.vad.is_speech(self._i16_scratch[:n].tobytes(), self.sample_rate)
+
+    # === Playback state (for barge-in) ===
+    def notify_speaking(self, speaking: bool):
+        """Tell the recorder TTS playback started/stopped so user speech
+        during playback can fire interrupt_callback."""
+        if speaking:
+            self.state = "speaking"
+        else:
+            self.state = "listening" if self.recording else "idle"
 
-        audio = []
-        with sd.InputStream(
+    # === Stream Management ===
+    def _ensure_stream(self):
+        """Open the input stream once; later utterances only drain the queue."""
+        if self._stream is not None:
+            return
+        import sounddevice as sd
+        self._stream = sd.InputStream(
             channels=1,
             samplerate=self.sample_rate,
             blocksize=self.block_size,
             dtype="float32",
+            latency="low",
             callback=self._callback
-        ):
-            self._last_voice_time = time.time()
-            while self.recording:
-                try:
-                    block = self.audio_queue.get(timeout=1)
-                except queue.Empty:
-                    continue
+        )
+        self._stream.start()
+        print("🎙️ Input stream opened")
 
-                audio.append(block)
+    def _close_stream(self):
+        if self._stream is None:
+            return
+        try:
+            self._stream.stop()
+            self._stream.close()
+        finally:
+            self._stream = None
+        print("🎙️ Input stream closed")
 
-                if self._is_speech(block):
-                    self._last_voice_time = time.time()
-                elif time.time() - self._last_voice_time > self.silence_duration:
-                    print(f"⏹️ Silence detected — stopping chunk after {time.time() - self._last_voice_time:.2f}s")
-                    break
+    # === Recording Loop ===
+    def _record_until_silence(self):
+        if self.status_callback:
+            self.status_callback("Listening...")
+
+        if self.state != "speaking":
+            self.state = "listening"
 
-        return np.concatenate(audio)
+        # The stream stays open across turns, so blocks captured during
+        # transcription/playback pile up in the deque — drop them so the
+        # new turn doesn't start with the tail of the previous utterance
+        # (or speaker echo) baked into its audio
+        self.audio_queue.clear()
+        self._audio_event.clear()
+
+        # Silero VAD is a stateful LSTM — reset it so state from the
+        # previous utterance doesn't bias this one
+        if self.vad_model is not None:
+            self.vad_model.reset_states()
+
+        write_ptr = 0
+        self._last_voice_time = time.time()
+        while self.recording:
+            try:
+                block = self.audio_queue.popleft()
+            except IndexError:
+                self._audio_event.wait(timeout=1)
+                self._audio_event.clear()
+                continue
+
+            if write_ptr + len(block) > len(self._audio_buf):
+                self._audio_buf = np.concatenate(
+                    [self._audio_buf, np.empty_like(self._audio_buf)]
+                )
+            self._audio_buf[write_ptr:write_ptr + len(block)] = block
+            write_ptr += len(block)
+
+            if self._is_speech(block):
+                if self.state == "speaking" and self.interrupt_callback:
+                    print("✋ User spoke during playback — interrupting TTS")
+                    self.interrupt_callback()
+                    self.state = "listening"
+                self._last_voice_time = time.time()
+            elif time.time() - self._last_voice_time > self.silence_duration:
+                print(f"⏹️ Silence detected — stopping chunk after {time.time() - self._last_voice_time:.2f}s")
+                break
+
+        self.state = "processing"
+        # View into the preallocated buffer — no copy before Whisper
+        return self._audio_buf[:write_ptr]
 
     # === Transcription ===
     def _transcribe(self, audio):
@@ -79,7 +257,13 @@ class VoiceRecorder:
             self.status_callback("Transcribing...")
         print("🧠 Transcribing...")
 
-        segments, _ = self.model.transcribe(audio, language="en")
+        segments, _ = self.model.transcribe(
+            audio,
+            language="en",
+            beam_size=1,
+            vad_filter=False,
+            condition_on_previous_text=False,
+        )
         full_text = " ".join(segment.text for segment in segments)
         print("📝 Transcript:", full_text)
         return full_text
@@ -95,9 +279,8 @@ class VoiceRecorder:
             transcript = self._transcribe(audio).strip().lower()
 
             # === Detect "switch to" or "swap to"
-            match = re.match(r"^(?:switch|swap)\s+to\s+(.+)$", transcript)
-            if match:
-                persona_name = re.sub(r'[^\w\s-]', '', match.group(1)).strip()
+            persona_name = PersonaService.try_parse_switch(transcript)
+            if persona_name:
                 print(f"🔄 Voice command detected — switching to persona: {persona_name}")
                 PersonaService.select_persona(persona_name)
             
@@ -138,10 +321,34 @@ class VoiceRecorder:
 
         self.recording = True
         self.status_callback = on_status
+        self._ensure_stream()
+        if not self._prewarmed:
+            self._prewarmed = True
+            threading.Thread(target=self._prewarm, daemon=True).start()
         thread = threading.Thread(target=self._run_loop, args=(callback,), daemon=True)
         thread.start()
 
+    # === Model Prewarm ===
+    def _prewarm(self):
+        """
+        Loads Whisper weights and runs a dummy decode in the background
+        so the first real utterance doesn't pay the 0.5–2 s cold start
+        (CTranslate2 graph build, BLAS init, vocabulary load). Overlaps
+        with the user's first utterance being recorded.
+        """
+        try:
+            self.model.transcribe(
+                np.zeros(self.sample_rate, dtype=np.float32),
+                language="en",
+                beam_size=1,
+            )
+            print("🔥 Whisper model prewarmed")
+        except Exception as e:
+            print(f"⚠️ Whisper prewarm failed: {e}")
+
     # === Stop Recording ===
     def stop(self):
         print("⏹️ Manual stop called")
         self.recording = False
+        self.state = "idle"
+        self._close_stream()
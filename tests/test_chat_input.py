@@ -120,6 +120,8 @@ class TestChatInput:
     
     def test_set_input_mode_keyboard(self, chat_input):
         """Test setting input mode to keyboard"""
+        # Recorder is built lazily on mic use, so enter mic mode first
+        chat_input.set_input_mode("mic")
         chat_input.set_input_mode("keyboard")
         
         assert chat_input.voice_mode is False
@@ -45,3 +45,26 @@ def test_select_persona(requests_mock):
 
     result = PersonaService.select_persona("Gwen")
     assert result["name"] == "Gwen"
+
+
+# === Test: Parsing switch/swap commands ===
+def test_try_parse_switch_plain_message():
+    assert PersonaService.try_parse_switch("hello there, how are you?") is None
+
+
+def test_try_parse_switch_basic():
+    assert PersonaService.try_parse_switch("switch to Luna") == "luna"
+
+
+def test_try_parse_switch_scrubs_punctuation():
+    assert PersonaService.try_parse_switch("Swap to Dr. Luna!") == "dr luna"
+
+
+def test_try_parse_switch_shortest_command():
+    # "swap to X" is exactly 9 chars — the length gate must let it through
+    assert PersonaService.try_parse_switch("swap to X") == "x"
+
+
+def test_try_parse_switch_false_prefix():
+    # Starts with "switch" but isn't a command
+    assert PersonaService.try_parse_switch("switching topics now") is None
@@ -16,9 +16,10 @@ def recorder():
 # ✅ Test: Initialization defaults are set correctly
 def test_init_defaults(recorder):
     assert recorder.sample_rate == 16000
-    assert recorder.block_size == 480
+    assert recorder.block_size == 512
     assert recorder.continuous_mode is True
     assert recorder.max_empty_loops == 3
+    assert recorder.state == "idle"
     assert callable(recorder._is_speech)
 
 
@@ -26,26 +27,33 @@ def test_init_defaults(recorder):
 def test_callback_adds_to_queue(recorder):
     dummy_data = np.ones((10, 1), dtype=np.float32)
     recorder._callback(dummy_data, frames=10, time_info=None, status=None)
-    assert not recorder.audio_queue.empty()
+    assert len(recorder.audio_queue) == 1
 
 
 # 🎙️ Test: _is_speech returns True/False via vad
 def test_is_speech_detection(recorder):
-    pcm_chunk = np.ones(480, dtype=np.float32)
-    with patch.object(recorder.vad, "is_speech", return_value=True):
-        assert recorder._is_speech(pcm_chunk) is True
+    pcm_chunk = np.ones(512, dtype=np.float32)
+    # Force the webrtcvad fallback path so the test is backend-agnostic
+    recorder.vad_model = None
+    recorder.vad = MagicMock()
+    recorder.vad.is_speech.return_value = True
+    assert recorder._is_speech(pcm_chunk) is True
 
 
 # 🎙️ Test: Recording stops after silence is detected
-@patch("chat_ui.voice_recorder.sd.InputStream")
 @patch.object(VoiceRecorder, "_is_speech", return_value=False)
-def test_record_until_silence(mock_is_speech, mock_stream, recorder):
+def test_record_until_silence(mock_is_speech, recorder):
     recorder.recording = True
-    for _ in range(3):
-        recorder.audio_queue.put(np.zeros(recorder.block_size, dtype=np.float32))
+
+    # Stale blocks from the previous turn get dropped at turn start, so
+    # feed fresh blocks the way the callback would — while listening
+    def feed_block(*args, **kwargs):
+        recorder.audio_queue.append(np.zeros(recorder.block_size, dtype=np.float32))
+        return True
 
     fake_time = itertools.count(start=0, step=2)  # increments by 2s
-    with patch("time.time", side_effect=lambda: next(fake_time)):
+    with patch.object(recorder._audio_event, "wait", side_effect=feed_block), \
+         patch("time.time", side_effect=lambda: next(fake_time)):
         audio = recorder._record_until_silence()
 
     assert isinstance(audio, np.ndarray)
@@ -116,7 +124,9 @@ def test_silent_loops_trigger_auto_stop(mock_record, recorder):
 
 # ▶️ Test: start_recording_async launches a thread
 def test_start_recording_async_starts_thread(recorder):
-    with patch.object(threading, "Thread", wraps=threading.Thread) as mock_thread:
+    with patch.object(VoiceRecorder, "_ensure_stream"), \
+         patch.object(VoiceRecorder, "_prewarm"), \
+         patch.object(threading, "Thread", wraps=threading.Thread) as mock_thread:
         recorder.start_recording_async(callback=lambda _: None)
         assert recorder.recording is True
         assert mock_thread.called